@@ -0,0 +1,63 @@
+###############################################################################
+## yabasco: Yet Another BAsic Smith Chart gizmO
+## Copyright (C) 2025  Kyle Thomas Goodman
+## email: kylegoodman@kgindustrial.com
+## GitHub: https://github.com/kgetech/
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## (at your option) any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program.  If not, see <https://www.gnu.org/licenses/>.
+###############################################################################
+## Purpose: Application-wide look and feel, set up before the main window.
+###############################################################################
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPalette
+
+_DARK_GREY = QColor(53, 53, 53)
+_NEAR_BLACK = QColor(25, 25, 25)
+_HIGHLIGHT_BLUE = QColor(42, 130, 218)
+
+# (role, color) pairs for the “Fusion” dark palette
+_DARK_PALETTE_ENTRIES = (
+    (QPalette.Window,             _DARK_GREY),
+    (QPalette.WindowText,         Qt.white),
+    (QPalette.Base,               _NEAR_BLACK),
+    (QPalette.AlternateBase,      _DARK_GREY),
+    (QPalette.ToolTipBase,        Qt.white),
+    (QPalette.ToolTipText,        Qt.white),
+    (QPalette.Text,               Qt.white),
+    (QPalette.Button,             _DARK_GREY),
+    (QPalette.ButtonText,         Qt.white),
+    (QPalette.BrightText,         Qt.red),
+    (QPalette.Link,               _HIGHLIGHT_BLUE),
+    (QPalette.Highlight,          _HIGHLIGHT_BLUE),
+    (QPalette.HighlightedText,    Qt.black),
+)
+
+def build_dark_palette():
+    """
+    Build the dark palette used across the application.
+    """
+    dark = QPalette()
+    for role, color in _DARK_PALETTE_ENTRIES:
+        dark.setColor(role, color)
+    return dark
+
+# Built once at import; callers get copies so the shared one is never altered
+_DARK_PALETTE = build_dark_palette()
+
+def dark_palette():
+    """
+    Return a copy of the prebuilt dark palette.
+    """
+    return QPalette(_DARK_PALETTE)
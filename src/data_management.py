@@ -27,6 +27,7 @@ from abc import ABC, abstractmethod
 from PyQt5.QtGui import QColor, QFont, QIcon, QWindow
 
 ## Get Constructors and Representers from yaml_everywhere.py
+from .yaml_everywhere import safe_dump, safe_load
 #from .yaml_everywhere import register_yaml_qt_types
 #register_yaml_qt_types()
 
@@ -169,32 +170,50 @@ class DataManagement:
         # fallback: convert anything else to str()
         return str(data)
 
-    def save_yaml(self, session_file):
+    def session_snapshot(self):
+        """
+        Capture the chart and window state as plain YAML-safe types.
+        """
+        chart_dict = asdict(self.chart)
+        window_dict = asdict(self.window)
+        # convert non-YAML-native objects into primitives
+        chart_safe = self._serialize(chart_dict)
+        window_safe = self._serialize(window_dict)
+        return {"chart": chart_safe, "window": window_safe}
+
+    def apply_session(self, session):
+        self.chart.parse_session(session.get("chart", {}))
+        self.window.parse_session(session.get("window", {}))
+
+    @staticmethod
+    def write_session(session_file, session):
+        """
+        Dump a session snapshot to disk. Touches no shared state, so it is
+        safe to call from a worker thread.
+        """
         with open(session_file, 'w') as outfile:
-            chart_dict = asdict(self.chart)
-            window_dict = asdict(self.window)
-            # convert non-YAML-native objects into primitives
-            chart_safe = self._serialize(chart_dict)
-            window_safe = self._serialize(window_dict)
-
-            yaml.dump(
-                {"chart": chart_safe, "window": window_safe},
-                #{"chart": chart_dict, "window": window_dict},
-                outfile,
-                Dumper=yaml.SafeDumper,
-                default_flow_style=False
-            )
+            safe_dump(session, outfile, default_flow_style=False)
 
-    def load_yaml(self, session_file):
+    @staticmethod
+    def read_session(session_file):
+        """
+        Parse a session file from disk. Touches no shared state, so it is
+        safe to call from a worker thread.
+        """
         with open(session_file, 'r') as stream:
-            try:
-                session = yaml.load(stream, Loader=yaml.FullLoader)
-                print(
-                    f"Loaded session from {session_file}:\n"
-                    f"  Chart: {session['chart']}\n"
-                    f"  Window: {session['window']}"
-                )
-                self.chart.parse_session(session.get("chart", {}))
-                self.window.parse_session(session.get("window", {}))
-            except yaml.YAMLError as yaml_exception:
-                print(yaml_exception)
\ No newline at end of file
+            return safe_load(stream)
+
+    def save_yaml(self, session_file):
+        self.write_session(session_file, self.session_snapshot())
+
+    def load_yaml(self, session_file):
+        try:
+            session = self.read_session(session_file)
+            print(
+                f"Loaded session from {session_file}:\n"
+                f"  Chart: {session['chart']}\n"
+                f"  Window: {session['window']}"
+            )
+            self.apply_session(session)
+        except yaml.YAMLError as yaml_exception:
+            print(yaml_exception)
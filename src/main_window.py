@@ -1,15 +1,57 @@
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QMainWindow, QDockWidget, QAction, QFileDialog, QMessageBox
 import yaml
 
 from .rf_objects_panel import RfObjectsPanel
 from .chart_settings_panel import ChartSettingsPanel
 
+class YamlWorker(QObject):
+    """
+    Parses and dumps session YAML off the GUI thread; results come back as signals.
+    """
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, data_manager):
+        super().__init__()
+        self.dm = data_manager
+
+    @pyqtSlot(str)
+    def load(self, session_file):
+        try:
+            session = self.dm.read_session(session_file)
+        except (yaml.YAMLError, OSError) as err:
+            self.failed.emit("Error Loading Session", str(err))
+            return
+        self.loaded.emit(session_file, session)
+
+    @pyqtSlot(str, object)
+    def save(self, session_file, session):
+        try:
+            self.dm.write_session(session_file, session)
+        except (yaml.YAMLError, OSError) as err:
+            self.failed.emit("Error Saving Session", str(err))
+
 class MainWindow(QMainWindow):
+    # Queued over to the YamlWorker thread
+    _load_requested = pyqtSignal(str)
+    _save_requested = pyqtSignal(str, object)
+
     def __init__(self, data_manager):
         super().__init__()
         self.dm = data_manager
 
+        # Session YAML I/O runs on its own thread so the UI stays responsive
+        self._yaml_thread = QThread(self)
+        self._yaml_worker = YamlWorker(self.dm)
+        self._yaml_worker.moveToThread(self._yaml_thread)
+        self._yaml_thread.finished.connect(self._yaml_worker.deleteLater)
+        self._load_requested.connect(self._yaml_worker.load)
+        self._save_requested.connect(self._yaml_worker.save)
+        self._yaml_worker.loaded.connect(self._on_session_loaded)
+        self._yaml_worker.failed.connect(self._on_session_failed)
+        self._yaml_thread.start()
+
         # Window title: call the method (or use attribute) to get a string
         title = (self.dm.window.WindowTitle()
                  if callable(self.dm.window.WindowTitle)
@@ -85,22 +127,28 @@ class MainWindow(QMainWindow):
                                             "YAML (*.yaml *.yml);;All Files (*.*)")
         if not fn:
             return
-        try:
-            self.dm.save_yaml(session_file=fn)
-        except yaml.YAMLError as err:
-            print(str(err))
-            QMessageBox.critical(self, "Error Saving Session", str(err))
+        # Snapshot on the GUI thread; only the dump happens on the worker
+        self._save_requested.emit(fn, self.dm.session_snapshot())
 
     def _load_session(self):
         fn, _ = QFileDialog.getOpenFileName(self, "Open Session YAML", "",
                                             "YAML (*.yaml *.yml);;All Files (*.*)")
         if not fn:
             return
-        try:
-            self.dm.load_yaml(session_file=fn)
-        except yaml.YAMLError as err:
-            QMessageBox.critical(self, "Error Loading Session", str(err))
-            return
+        self._load_requested.emit(fn)
+
+    def _on_session_loaded(self, session_file, session):
+        print(f"Loaded session from {session_file}")
+        self.dm.apply_session(session)
+
+    def _on_session_failed(self, title, message):
+        print(message)
+        QMessageBox.critical(self, title, message)
+
+    def closeEvent(self, event):
+        self._yaml_thread.quit()
+        self._yaml_thread.wait()
+        super().closeEvent(event)
 
     def _save_chart(self,path):
         self.dm.chart.fig.savefig(path, dpi=300)
\ No newline at end of file
@@ -16,7 +16,6 @@
 ##
 ###########################################################################################
 
-import numpy as np
 from typing import Dict
 
 from PyQt5.QtCore import Qt
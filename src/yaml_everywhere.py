@@ -1,45 +1,100 @@
+import functools
+
 import yaml
 from PyQt5.QtGui import QColor, QFont, QIcon
 from PyQt5.QtCore import QPoint, QSize
 
+# Prefer the LibYAML-backed classes; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+safe_dump = functools.partial(yaml.dump, Dumper=SafeDumper)
+safe_load = functools.partial(yaml.load, Loader=SafeLoader)
+
+# Unbound Qt accessors, bound into the representers as defaults so each call
+# is a local lookup rather than a method resolution on the PyQt wrapper
+_qcolor_name = QColor.name
+_qpoint_x = QPoint.x
+_qpoint_y = QPoint.y
+_qsize_w = QSize.width
+_qsize_h = QSize.height
+_qicon_name = QIcon.name
+
+# Loaded colors and icons repeat heavily across a session, so construction is
+# cached. The returned instances are shared: do not mutate them in place, take
+# a copy (QColor(color), QIcon(icon)) when a modified value is needed.
+@functools.lru_cache(maxsize=256)
+def _qcolor_from_name(name):
+    return QColor(name)
+
+@functools.lru_cache(maxsize=1024)
+def _qicon_from_path(path):
+    return QIcon(path)
+
+# Representers and constructors for each Qt type
+def _repr_qcolor(dumper, obj, _name=_qcolor_name):
+    return dumper.represent_scalar('!QColor', _name(obj))
+
+def _ctor_qcolor(loader, node):
+    return _qcolor_from_name(loader.construct_scalar(node))
+
+def _repr_qfont_style(dumper, obj):
+    return dumper.represent_scalar('!QFontStyle', str(int(obj)))
+
+def _ctor_qfont_style(loader, node):
+    return QFont.Style(int(loader.construct_scalar(node)))
+
+def _repr_qfont_weight(dumper, obj):
+    return dumper.represent_scalar('!QFontWeight', str(int(obj)))
+
+def _ctor_qfont_weight(loader, node):
+    return QFont.Weight(int(loader.construct_scalar(node)))
+
+def _repr_qpoint(dumper, obj, _x=_qpoint_x, _y=_qpoint_y):
+    return dumper.represent_sequence('!QPoint', [_x(obj), _y(obj)])
+
+def _ctor_qpoint(loader, node):
+    return QPoint(*loader.construct_sequence(node))
+
+def _repr_qsize(dumper, obj, _w=_qsize_w, _h=_qsize_h):
+    return dumper.represent_sequence('!QSize', [_w(obj), _h(obj)])
+
+def _ctor_qsize(loader, node):
+    return QSize(*loader.construct_sequence(node))
+
+def _repr_qicon(dumper, obj, _name=_qicon_name):
+    return dumper.represent_scalar('!QIcon', _name(obj))
+
+def _ctor_qicon(loader, node):
+    return _qicon_from_path(loader.construct_scalar(node))
+
 # Central registry of (Python type, YAML tag, representer, constructor)
-_YAML_REGISTRY = [
-    (
-        QColor, '!QColor',
-        lambda dumper, obj: dumper.represent_scalar('!QColor', obj.name()),
-        lambda loader, node: QColor(loader.construct_scalar(node))
-    ),
-    (
-        QFont.Style, '!QFontStyle',
-        lambda dumper, obj: dumper.represent_scalar('!QFontStyle', str(int(obj))),
-        lambda loader, node: QFont.Style(int(loader.construct_scalar(node)))
-    ),
-    (
-        QFont.Weight, '!QFontWeight',
-        lambda dumper, obj: dumper.represent_scalar('!QFontWeight', str(int(obj))),
-        lambda loader, node: QFont.Weight(int(loader.construct_scalar(node)))
-    ),
-    (
-        QPoint, '!QPoint',
-        lambda dumper, obj: dumper.represent_sequence('!QPoint', [obj.x(), obj.y()]),
-        lambda loader, node: QPoint(*loader.construct_sequence(node))
-    ),
-    (
-        QSize, '!QSize',
-        lambda dumper, obj: dumper.represent_sequence('!QSize', [obj.width(), obj.height()]),
-        lambda loader, node: QSize(*loader.construct_sequence(node))
-    ),
-    (
-        QIcon, '!QIcon',
-        lambda dumper, obj: dumper.represent_scalar('!QIcon', obj.name()),
-        lambda loader, node: QIcon(loader.construct_scalar(node))
-    ),
-]
+_YAML_REGISTRY: tuple = (
+    (QColor, '!QColor', _repr_qcolor, _ctor_qcolor),
+    (QFont.Style, '!QFontStyle', _repr_qfont_style, _ctor_qfont_style),
+    (QFont.Weight, '!QFontWeight', _repr_qfont_weight, _ctor_qfont_weight),
+    (QPoint, '!QPoint', _repr_qpoint, _ctor_qpoint),
+    (QSize, '!QSize', _repr_qsize, _ctor_qsize),
+    (QIcon, '!QIcon', _repr_qicon, _ctor_qicon),
+)
+
+_REGISTERED = False
 
 def register_yaml_qt_types():
     """
-    Register custom YAML representers and constructors for common Qt types.
+    Register custom YAML representers and constructors for common Qt types
+    on both the pure-Python and LibYAML safe classes. Repeated calls are no-ops.
     """
+    global _REGISTERED
+    if _REGISTERED:
+        return
+    dumpers = {yaml.SafeDumper, SafeDumper}
+    loaders = {yaml.SafeLoader, SafeLoader}
     for py_type, tag, repr_fn, ctor_fn in _YAML_REGISTRY:
-        yaml.SafeDumper.add_representer(py_type, repr_fn)
-        yaml.SafeLoader.add_constructor(tag, ctor_fn)
\ No newline at end of file
+        for dumper in dumpers:
+            dumper.add_representer(py_type, repr_fn)
+        for loader in loaders:
+            loader.add_constructor(tag, ctor_fn)
+    _REGISTERED = True
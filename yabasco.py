@@ -19,10 +19,9 @@
 ###############################################################################
 import sys, getopt
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QPalette
 from PyQt5.QtWidgets import QApplication
 
+from src.app_bootstrap import dark_palette
 from src.main_window import MainWindow
 
 from src.data_management import DataManagement
@@ -36,21 +35,7 @@ def main():
     app.setStyle('Fusion')
 
     # Apply a “Fusion” dark palette to match JetBrains‐quality UX
-    dark = QPalette()
-    dark.setColor(QPalette.Window,             QColor(53, 53, 53))
-    dark.setColor(QPalette.WindowText,         Qt.white)
-    dark.setColor(QPalette.Base,               QColor(25, 25, 25))
-    dark.setColor(QPalette.AlternateBase,      QColor(53, 53, 53))
-    dark.setColor(QPalette.ToolTipBase,        Qt.white)
-    dark.setColor(QPalette.ToolTipText,        Qt.white)
-    dark.setColor(QPalette.Text,               Qt.white)
-    dark.setColor(QPalette.Button,             QColor(53, 53, 53))
-    dark.setColor(QPalette.ButtonText,         Qt.white)
-    dark.setColor(QPalette.BrightText,         Qt.red)
-    dark.setColor(QPalette.Link,               QColor(42, 130, 218))
-    dark.setColor(QPalette.Highlight,          QColor(42, 130, 218))
-    dark.setColor(QPalette.HighlightedText,    Qt.black)
-    app.setPalette(dark)
+    app.setPalette(dark_palette())
 
     # Command Line Argument Parsing
     args = sys.argv[1:]